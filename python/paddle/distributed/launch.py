@@ -50,10 +50,14 @@ from paddle.distributed import cloud_utils
 
 
 def _print_arguments(args):
-    print("-----------  Configuration Arguments -----------")
+    # buffer the whole config block and emit it with a single write,
+    # one syscall instead of one per line when stdout is line buffered
+    lines = ["-----------  Configuration Arguments -----------"]
     for arg, value in sorted(six.iteritems(vars(args))):
-        print("%s: %s" % (arg, value))
-    print("------------------------------------------------")
+        lines.append("%s: %s" % (arg, value))
+    lines.append("------------------------------------------------\n")
+    sys.stdout.write("\n".join(lines))
+    sys.stdout.flush()
 
 
 def _parse_args():
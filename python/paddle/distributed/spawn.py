@@ -14,12 +14,20 @@
 
 from __future__ import print_function, division
 
+import atexit
 import multiprocessing
 import os
+import pickle
+import select
 import signal
 import six
+import struct
 import sys
+import tempfile
+import time
 import warnings
+from concurrent.futures import ThreadPoolExecutor
+from six.moves import queue
 
 from paddle.distributed.launch import get_cluster_and_pod, _print_arguments
 from paddle.distributed.utils import _prepare_trainer_env
@@ -30,7 +38,23 @@ from paddle.fluid import core
 from paddle.fluid.framework import _cpu_num
 
 
-# NOTE(chenweihang): The existence of this class leads to 
+# NOTE(chenweihang): [ how are results returned to the parent? ]
+# Each process owns one fixed-size slot in a shared memory slab,
+# laid out as a 1 byte status, a 4 byte payload length and the
+# pickled payload. The slot is only read by the parent after the
+# process exited, so no queue synchronization is needed. Payloads
+# larger than one slot fall back to a single shared overflow queue
+_SLOT_SIZE = 64 * 1024
+_SLOT_HEADER = struct.Struct('<BI')
+
+# slot status codes, an unwritten slot keeps _STATUS_EMPTY
+_STATUS_EMPTY = 0
+_STATUS_SUCCESS = 1
+_STATUS_ERROR = 2
+_STATUS_OVERFLOW = 3
+
+
+# NOTE(chenweihang): The existence of this class leads to
 # the maintenance of two arguments. When the launch.py arguments 
 # is updated, the arguments here also need to be updated, 
 # but I have not thought of a better way here
@@ -71,7 +95,7 @@ def _py_supported_check():
 def _options_valid_check(options):
     supported_options = [
         'start_method', 'cluster_node_ips', 'node_ip', 'started_port',
-        'selected_gpus', 'print_config', 'use_paddlecloud'
+        'selected_gpus', 'print_config', 'use_paddlecloud', 'persistent'
     ]
     for key in options:
         if key not in supported_options:
@@ -80,10 +104,7 @@ def _options_valid_check(options):
                 % key)
 
 
-def _get_subprocess_env_list(nprocs, options):
-    # contruct processes env list
-    processes_env_list = []
-
+def _get_subprocess_env_list(nprocs, options, cuda_dev_cnt=None):
     # get args from kwargs
     args = ParallelEnvArgs()
 
@@ -106,15 +127,20 @@ def _get_subprocess_env_list(nprocs, options):
     # if we set FLAGS_selected_gpus to be `0,1,2,3`, it may cause error
     # when using `ParallelEnv`
     # NOTE(chenweihang): use absolute gpu card id
+    # NOTE(chenweihang): `get_cuda_device_count` initializes the CUDA
+    # driver runtime, which can cost tens of milliseconds, so only
+    # query it when `CUDA_VISIBLE_DEVICES` gives no answer
     args.selected_gpus = options.get('selected_gpus', None)
     env_devices = os.getenv("CUDA_VISIBLE_DEVICES", None)
-    if env_devices is None or env_devices == "":
-        env_devices_list = [
-            str(x) for x in six.moves.range(core.get_cuda_device_count())
-        ]
-    else:
-        env_devices_list = env_devices.split(',')
     if args.selected_gpus is None:
+        if env_devices is None or env_devices == "":
+            if cuda_dev_cnt is None:
+                cuda_dev_cnt = core.get_cuda_device_count()
+            env_devices_list = [
+                str(x) for x in six.moves.range(cuda_dev_cnt)
+            ]
+        else:
+            env_devices_list = env_devices.split(',')
         if len(env_devices_list) < nprocs:
             raise RuntimeError(
                 "the number of visible devices(%d) is less than the number "
@@ -124,12 +150,33 @@ def _get_subprocess_env_list(nprocs, options):
                 (len(env_devices_list), nprocs))
         args.selected_gpus = ",".join(
             [str(env_devices_list[x]) for x in range(0, nprocs)])
-    else:
+    elif env_devices is None or env_devices == "":
+        if cuda_dev_cnt is None:
+            cuda_dev_cnt = core.get_cuda_device_count()
         for card_id in args.selected_gpus.split(','):
-            if card_id not in env_devices_list:
-                raise ValueError("The selected gpu card %s cannot found in "
-                                 "CUDA_VISIBLE_DEVICES (%s)." %
-                                 (card_id, ",".join(env_devices_list)))
+            try:
+                card_id_valid = 0 <= int(card_id) < cuda_dev_cnt
+            except ValueError:
+                # a non-numeric card id can never name a device
+                card_id_valid = False
+            if not card_id_valid:
+                raise ValueError(
+                    "The selected gpu card %s cannot found in "
+                    "CUDA_VISIBLE_DEVICES (%s)." %
+                    (card_id, ",".join(
+                        [str(x) for x in six.moves.range(cuda_dev_cnt)])))
+    else:
+        # validate with one set membership test per card and report
+        # all missing cards at once instead of stopping at the first
+        env_devices_set = frozenset(env_devices.split(','))
+        missing_cards = [
+            card_id for card_id in args.selected_gpus.split(',')
+            if card_id not in env_devices_set
+        ]
+        if missing_cards:
+            raise ValueError("The selected gpu cards %s cannot found in "
+                             "CUDA_VISIBLE_DEVICES (%s)." %
+                             (",".join(missing_cards), env_devices))
 
     # set other arguments
     args.started_port = options.get('started_port', None)
@@ -139,72 +186,196 @@ def _get_subprocess_env_list(nprocs, options):
     # reuse code of launch.py
     cluster, pod = get_cluster_and_pod(args)
 
-    # prepare subprocess env list
-    for trainer in pod.trainers:
-        processes_env_list.append(_prepare_trainer_env(cluster, trainer))
-
     # print config
     if args.print_config:
         _print_arguments(args)
 
-    return processes_env_list
+    # NOTE(chenweihang): [ why return a generator? ]
+    # The env dicts are produced on demand so no intermediate list of
+    # all of them is built here; spawn() binds each dict directly to
+    # the Process that carries it. The dicts themselves stay alive as
+    # Process args until the processes are released, so this saves the
+    # extra container, not the dicts
+    return (_prepare_trainer_env(cluster, trainer) for trainer in pod.trainers)
+
+
+# proxy vars interfere with the trainers' own communication, both
+# lower and upper case spellings are honored by common http stacks
+_RISKY_ENV_VARS = ("http_proxy", "https_proxy", "no_proxy", "HTTP_PROXY",
+                   "HTTPS_PROXY", "NO_PROXY")
 
 
 def _remove_risky_env():
     # remove useless env vars, same as launch.py
     # no copy, each process will hold env vars itself
-    os.environ.pop("http_proxy", None)
-    os.environ.pop("https_proxy", None)
+    for var_name in _RISKY_ENV_VARS:
+        os.environ.pop(var_name, None)
 
 
 def _set_trainer_env(env_dict):
-    for var_name in env_dict:
-        os.environ[var_name] = env_dict[var_name]
+    # NOTE(chenweihang): setting vars one by one rewrites the C-level
+    # environ table once per var, update sets them in a single pass
+    os.environ.update(env_dict)
+
+
+def _trim_worker_memory():
+    # NOTE: glibc keeps freed arenas assigned to the process, so a
+    # worker that stays alive after training (checkpoint save, pooled
+    # workers) shows a slowly growing RSS. Hand the arenas back to
+    # the OS once the user function finished. Opt out by setting
+    # PADDLE_MALLOC_TRIM=0
+    if os.getenv('PADDLE_MALLOC_TRIM', '1') != '1':
+        return
+    if not sys.platform.startswith('linux'):
+        return
+    try:
+        import ctypes
+        import gc
+        gc.collect()
+        ctypes.CDLL('libc.so.6', use_errno=True).malloc_trim(0)
+    except (OSError, AttributeError):
+        pass
+
+
+def _write_result_slot(slab, overflows, rank, status, payload):
+    offset = rank * _SLOT_SIZE
+    if _SLOT_HEADER.size + len(payload) > _SLOT_SIZE:
+        # NOTE: putting the payload itself on the queue would block
+        # the child's feeder thread on the pipe once the payload
+        # exceeds the pipe buffer, while the parent only drains the
+        # queue after the child exited -- a deadlock. Spill the
+        # payload to a temp file and send only its short path, which
+        # always fits the pipe without blocking
+        fd, payload_path = tempfile.mkstemp(prefix='paddle_spawn_result_')
+        with os.fdopen(fd, 'wb') as f:
+            f.write(payload)
+        slab[offset:offset + _SLOT_HEADER.size] = _SLOT_HEADER.pack(
+            _STATUS_OVERFLOW, 0)
+        overflows.put((rank, status, payload_path))
+    else:
+        data = _SLOT_HEADER.pack(status, len(payload)) + payload
+        slab[offset:offset + len(data)] = data
 
 
-def _func_wrapper(func, args, error_queue, return_queue, env_dict):
+def _func_wrapper(payload, rank, slab, overflows, env_dict):
     try:
         # config subprocess environment variables
         _remove_risky_env()
         _set_trainer_env(env_dict)
         # execute function
+        func, args = pickle.loads(payload)
         result = func(*args)
         # record function return value
-        return_queue.put(result)
+        _write_result_slot(slab, overflows, rank, _STATUS_SUCCESS,
+                           pickle.dumps(result, pickle.HIGHEST_PROTOCOL))
+        _trim_worker_memory()
     except KeyboardInterrupt:
         pass
     except Exception:
         import traceback
-        error_queue.put(traceback.format_exc())
+        _write_result_slot(slab, overflows, rank, _STATUS_ERROR,
+                           traceback.format_exc().encode('utf-8'))
         sys.exit(1)
 
 
 class MultiprocessContext(object):
-    def __init__(self, processes, error_queues, return_queues):
+    def __init__(self, processes, slab, overflows):
         _py_supported_check()
-        self.error_queues = error_queues
-        # NOTE(chenweihang): The `spawn` method is mainly used 
-        # to wrap the outermost execution function of the program for 
-        # parallel execution. Generally, the return value is not concerned, 
-        # but if the user needs to obtain the return value, users can get  
-        # the return result of each process from context.return_queues
-        self.return_queues = return_queues
+        self._result_slab = slab
+        self._overflows = overflows
+        self._overflow_payloads = {}
         self.processes = processes
-        self.sentinels = {
-            process.sentinel: index
-            for index, process in enumerate(processes)
-        }
+        # NOTE(chenweihang): [ why parallel arrays instead of a dict? ]
+        # The sentinel list and the fd->rank table are built exactly
+        # once; a finished sentinel is marked -1 in place and a
+        # remaining counter tracks liveness, so joining never mutates
+        # and rehashes a dict per exit event
+        # NOTE(chenweihang): [ why pidfd? ]
+        # On Linux 5.3+ a pidfd becomes readable exactly when its
+        # process exits, and one poll on the shared epoll instance
+        # reports every exited process in a single syscall. Where
+        # pidfd_open is unavailable the sentinel pipes are watched
+        # instead
+        self._fds_are_pidfds = False
+        fds = None
+        if hasattr(os, 'pidfd_open'):
+            fds = []
+            try:
+                for process in processes:
+                    fds.append(os.pidfd_open(process.pid))
+                self._fds_are_pidfds = True
+            except OSError:
+                for fd in fds:
+                    os.close(fd)
+                fds = None
+        if fds is None:
+            fds = [process.sentinel for process in processes]
+        self._fds = fds
+        self._fd_to_idx = {fd: i for i, fd in enumerate(self._fds)}
+        self._remaining = len(processes)
+        # NOTE(chenweihang): [ why keep an epoll instance? ]
+        # connection.wait rebuilds its fd set on every call, reusing
+        # one epoll instance registers each sentinel exactly once and
+        # unregisters it when its process exits. Sentinel fds become
+        # readable on process exit. Falls back to connection.wait on
+        # platforms without epoll
+        self._epoll = None
+        if hasattr(select, 'epoll'):
+            self._epoll = select.epoll()
+            for fd in self._fds:
+                self._epoll.register(fd, select.EPOLLIN)
+
+    def wait(self):
+        # NOTE(chenweihang): block until all processes end, the kernel
+        # sleeps the driver thread between process exits instead of
+        # re-entering python once per exited process
+        while self._remaining:
+            self._poll_once(timeout=None)
 
     def join(self, timeout=None):
-        if len(self.sentinels) == 0:
+        return self._poll_once(timeout=timeout)
+
+    def _close_poller(self):
+        if self._epoll is not None:
+            self._epoll.close()
+            self._epoll = None
+        if self._fds_are_pidfds:
+            for index, fd in enumerate(self._fds):
+                if fd != -1:
+                    os.close(fd)
+                    self._fds[index] = -1
+
+    def _release_fd(self, index):
+        fd = self._fds[index]
+        self._fds[index] = -1
+        self._remaining -= 1
+        if self._fds_are_pidfds:
+            os.close(fd)
+
+    def _poll_ready_sentinels(self, timeout=None):
+        if self._epoll is None:
+            return multiprocessing.connection.wait(
+                [fd for fd in self._fds if fd != -1], timeout=timeout)
+        # epoll.poll takes its timeout in seconds, -1 blocks forever
+        ready = [
+            fd for fd, _ in self._epoll.poll(-1 if timeout is None else
+                                             timeout)
+        ]
+        for fd in ready:
+            self._epoll.unregister(fd)
+        return ready
+
+    def _poll_once(self, timeout=None):
+        if self._remaining == 0:
+            self._close_poller()
             return True
 
-        ready = multiprocessing.connection.wait(
-            self.sentinels.keys(), timeout=timeout)
+        ready = self._poll_ready_sentinels(timeout=timeout)
 
         error_index = None
         for sentinel in ready:
-            index = self.sentinels.pop(sentinel)
+            index = self._fd_to_idx[sentinel]
+            self._release_fd(index)
             process = self.processes[index]
             process.join()
             if process.exitcode != 0:
@@ -212,17 +383,83 @@ class MultiprocessContext(object):
                 break
 
         if error_index is None:
-            return len(self.sentinels) == 0
+            if self._remaining == 0:
+                self._close_poller()
+                return True
+            return False
 
-        for process in self.processes:
+        self._close_poller()
+        self._terminate_all()
+        self._throw_exception(error_index)
+
+    def _terminate_all(self, timeout=5.0):
+        # signal every live sibling first, then join them against one
+        # shared deadline, so the shutdown latencies overlap instead
+        # of accumulating once per process
+        alive = [process for process in self.processes if process.is_alive()]
+        for process in alive:
+            process.terminate()
+        deadline = time.monotonic() + timeout
+        for process in alive:
+            process.join(max(0.0, deadline - time.monotonic()))
+        for process in alive:
             if process.is_alive():
-                process.terminate()
+                # Process.kill requires python 3.7
+                getattr(process, 'kill', process.terminate)()
+        for process in self.processes:
             process.join()
 
-        self._throw_exception(error_index)
+    def _read_result_slot(self, rank):
+        offset = rank * _SLOT_SIZE
+        status, length = _SLOT_HEADER.unpack(
+            bytes(self._result_slab[offset:offset + _SLOT_HEADER.size]))
+        if status != _STATUS_OVERFLOW:
+            payload_start = offset + _SLOT_HEADER.size
+            return status, bytes(self._result_slab[payload_start:payload_start
+                                                   + length])
+        while rank not in self._overflow_payloads:
+            try:
+                index, real_status, payload_path = self._overflows.get(
+                    timeout=1)
+            except queue.Empty:
+                # the child wrote the overflow marker but died before
+                # its queue feeder flushed the path (e.g. it was
+                # terminated when a sibling failed), report the slot
+                # as unwritten instead of blocking forever
+                if not self.processes[rank].is_alive():
+                    return _STATUS_EMPTY, b''
+                continue
+            try:
+                with open(payload_path, 'rb') as f:
+                    payload = f.read()
+                os.remove(payload_path)
+            except (IOError, OSError):
+                payload = b''
+                real_status = _STATUS_EMPTY
+            self._overflow_payloads[index] = (real_status, payload)
+        return self._overflow_payloads[rank]
+
+    @property
+    def returns(self):
+        # NOTE(chenweihang): The `spawn` method is mainly used
+        # to wrap the outermost execution function of the program for
+        # parallel execution. Generally, the return value is not concerned,
+        # but if the user needs to obtain the return value, users can get
+        # the return result of each process from context.returns
+        results = []
+        for rank in range(len(self.processes)):
+            status, payload = self._read_result_slot(rank)
+            results.append(
+                pickle.loads(payload) if status == _STATUS_SUCCESS else None)
+        return results
 
     def _throw_exception(self, error_index):
-        if self.error_queues[error_index].empty():
+        original_trace = None
+        status, payload = self._read_result_slot(error_index)
+        if status == _STATUS_ERROR:
+            original_trace = payload.decode('utf-8')
+
+        if original_trace is None:
             exitcode = self.processes[error_index].exitcode
             if exitcode < 0:
                 name = signal.Signals(-exitcode).name
@@ -232,7 +469,6 @@ class MultiprocessContext(object):
                 raise Exception("Process %d terminated with exit code %d." & (
                     error_index, exitcode))
 
-        original_trace = self.error_queues[error_index].get()
         msg = "\n\n----------------------------------------------\n" \
               "Process %d terminated with the following error:\n" \
               "----------------------------------------------\n\n" % error_index
@@ -240,6 +476,185 @@ class MultiprocessContext(object):
         raise Exception(msg)
 
 
+# NOTE(chenweihang): [ why keep a persistent worker pool? ]
+# When user code calls `spawn` repeatedly (e.g. hyperparameter
+# sweeps), each call re-forks nprocs processes and pays the full
+# interpreter and CUDA initialization again. With persistent=True
+# the workers are started once and later calls only re-dispatch the
+# function through task queues, the pool lives until it is shut down
+# at interpreter exit or a call with a different shape replaces it
+_WORKER_POOL = None
+_pool_exit_hooked = False
+
+
+def _worker_loop(rank, task_queue, result_queue):
+    _remove_risky_env()
+    # pre-bind the callables used on every dispatch so the loop body
+    # runs on local variable loads instead of repeated global and
+    # attribute lookups, which matters when the dispatched function
+    # itself is short
+    get_task = task_queue.get
+    put_result = result_queue.put
+    loads = pickle.loads
+    set_env = _set_trainer_env
+    while True:
+        task = get_task()
+        if task is None:
+            break
+        call_id, payload, env_dict = task
+        try:
+            set_env(env_dict)
+            func, args = loads(payload)
+            put_result((call_id, rank, _STATUS_SUCCESS, func(*args)))
+            _trim_worker_memory()
+        except KeyboardInterrupt:
+            break
+        except Exception:
+            import traceback
+            put_result((call_id, rank, _STATUS_ERROR, traceback.format_exc()))
+
+
+class _WorkerPool(object):
+    def __init__(self, nprocs, start_method, daemon):
+        self.nprocs = nprocs
+        self.start_method = start_method
+        mp = multiprocessing.get_context(start_method)
+        self._task_queues = [mp.Queue() for _ in range(nprocs)]
+        self._result_queue = mp.Queue()
+        # NOTE: each dispatch gets its own call id and results carry
+        # it back, so overlapping contexts created with join=False
+        # never steal each other's results; answers that belong to
+        # another pending call are stashed until that call collects
+        self._call_counter = 0
+        self._stashed = {}
+        self._partials = {}
+        self.processes = []
+        for rank in range(nprocs):
+            process = mp.Process(
+                target=_worker_loop,
+                args=(rank, self._task_queues[rank], self._result_queue))
+            process.daemon = daemon
+            process.start()
+            self.processes.append(process)
+
+    def alive(self):
+        return all(process.is_alive() for process in self.processes)
+
+    def dispatch(self, payload, procs_env_list):
+        self._call_counter += 1
+        call_id = self._call_counter
+        for task_queue, proc_env in zip(self._task_queues, procs_env_list):
+            task_queue.put((call_id, payload, proc_env))
+        return call_id
+
+    def collect(self, call_id, timeout=None):
+        # partial results survive a timed-out collect in _partials, so
+        # a later collect for the same call resumes where this one
+        # stopped; returns None when the timeout expires first
+        returns, collected_ranks = self._partials.setdefault(
+            call_id, ([None] * self.nprocs, set()))
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while len(collected_ranks) < self.nprocs:
+            stash = self._stashed.get(call_id)
+            if stash:
+                rank, status, value = stash.pop()
+            else:
+                poll = 1.0
+                if deadline is not None:
+                    poll = min(poll, deadline - time.monotonic())
+                    if poll <= 0:
+                        return None
+                try:
+                    result_call_id, rank, status, value = \
+                        self._result_queue.get(timeout=poll)
+                except queue.Empty:
+                    # a dead worker will never answer, no matter how
+                    # it exited, check liveness instead of blocking
+                    # forever
+                    for index, process in enumerate(self.processes):
+                        if process.is_alive() or index in collected_ranks:
+                            continue
+                        exitcode = process.exitcode
+                        self.shutdown()
+                        raise Exception(
+                            "Process %d exited with code %d before "
+                            "reporting its result." % (index, exitcode))
+                    continue
+                if result_call_id != call_id:
+                    self._stashed.setdefault(result_call_id, []).append(
+                        (rank, status, value))
+                    continue
+            if status == _STATUS_ERROR:
+                self.shutdown()
+                msg = "\n\n----------------------------------------------\n" \
+                      "Process %d terminated with the following error:\n" \
+                      "----------------------------------------------\n\n" % rank
+                msg += value
+                raise Exception(msg)
+            returns[rank] = value
+            collected_ranks.add(rank)
+        self._partials.pop(call_id, None)
+        self._stashed.pop(call_id, None)
+        return returns
+
+    def shutdown(self):
+        global _WORKER_POOL
+        for task_queue in self._task_queues:
+            task_queue.put(None)
+        for process in self.processes:
+            process.join()
+        if _WORKER_POOL is self:
+            _WORKER_POOL = None
+
+
+class _WorkerPoolContext(object):
+    # mimics the blocking interface of `MultiprocessContext` for the
+    # pool-backed mode, one instance corresponds to one dispatch
+    def __init__(self, pool, call_id):
+        self._pool = pool
+        self._call_id = call_id
+        self.processes = pool.processes
+        self.returns = None
+
+    def wait(self):
+        if self.returns is None:
+            self.returns = self._pool.collect(self._call_id)
+
+    def join(self, timeout=None):
+        # same contract as MultiprocessContext.join: False when the
+        # results are not all in before the timeout expires
+        if self.returns is None:
+            self.returns = self._pool.collect(self._call_id, timeout=timeout)
+        return self.returns is not None
+
+
+def _shutdown_worker_pool():
+    if _WORKER_POOL is not None:
+        _WORKER_POOL.shutdown()
+
+
+def _spawn_persistent(func, args, nprocs, join, daemon, start_method,
+                      procs_env_list):
+    global _WORKER_POOL, _pool_exit_hooked
+    if _WORKER_POOL is not None and (_WORKER_POOL.nprocs != nprocs or
+                                     _WORKER_POOL.start_method != start_method
+                                     or not _WORKER_POOL.alive()):
+        _WORKER_POOL.shutdown()
+    if _WORKER_POOL is None:
+        _WORKER_POOL = _WorkerPool(nprocs, start_method, daemon)
+        if not _pool_exit_hooked:
+            atexit.register(_shutdown_worker_pool)
+            _pool_exit_hooked = True
+
+    payload = pickle.dumps((func, args), pickle.HIGHEST_PROTOCOL)
+    call_id = _WORKER_POOL.dispatch(payload, procs_env_list)
+
+    context = _WorkerPoolContext(_WORKER_POOL, call_id)
+    if join:
+        context.wait()
+    return context
+
+
 def spawn(func, args=(), nprocs=-1, join=True, daemon=False, **options):
     """
     Start multiple processes with ``spawn`` method for parallel training.
@@ -265,9 +680,10 @@ def spawn(func, args=(), nprocs=-1, join=True, daemon=False, **options):
             configuration options. The following options are currently supported: 
             (1) start_method (string): the way to start a process. 
             The start method can be ``spawn`` , ``fork`` , ``forkserver`` . 
-            Because the CUDA runtime does not support the ``fork`` start method, 
-            when use CUDA in subprocesses, we should start process by ``spawn`` 
-            or ``forkserver`` method. Default: "spawn" ; 
+            Because the CUDA runtime does not support the ``fork`` start method,
+            when use CUDA in subprocesses, we should start process by ``spawn``
+            or ``forkserver`` method. The default is ``forkserver`` on Linux
+            when paddle is a cpu-only build, and ``spawn`` otherwise;
             (2) cluster_node_ips (string): Paddle cluster nodes ips, such as 
             "192.168.0.16,192.168.0.17". Default: "127.0.0.1"; 
             (3) node_ip (string): The current node ip, such as "192.168.0.16". 
@@ -277,8 +693,12 @@ def spawn(func, args=(), nprocs=-1, join=True, daemon=False, **options):
             (5) selected_gpus (string): The training process will run on the 
             selected_gpus, such as "0,1,2,3". Default: None; 
             (6) print_config (bool): Print current parallel training config. Default: False;
-            (7) use_paddlecloud (bool): Whether to use paddlecloud platform to run your 
-            multi-process job. Default: False.
+            (7) use_paddlecloud (bool): Whether to use paddlecloud platform to run your
+            multi-process job. Default: False;
+            (8) persistent (bool): Keep the spawned processes alive as a worker
+            pool and reuse them across repeated ``spawn`` calls instead of
+            starting new processes each time. The pool is shut down at
+            interpreter exit. Default: False.
 
     Returns:
         ``MultiprocessContext`` object, it hold the spawned processes.
@@ -373,52 +793,86 @@ def spawn(func, args=(), nprocs=-1, join=True, daemon=False, **options):
     _options_valid_check(options)
 
     # get default nprocs
+    # NOTE(chenweihang): cache the cuda device count queried here so
+    # that `_get_subprocess_env_list` does not initialize the CUDA
+    # driver runtime a second time for the same answer
+    cuda_dev_cnt = None
     if nprocs == -1:
         device = get_device()
         if device == 'cpu':
             # TODO: not supports cpu parallel now
             nprocs = _cpu_num()
         else:
-            nprocs = core.get_cuda_device_count()
+            cuda_dev_cnt = core.get_cuda_device_count()
+            nprocs = cuda_dev_cnt
 
     # NOTE(chenweihang): [ why need get cluster info before run? ]
     # when using `paddle.distributed.spawn` start parallel training, 
     # we should get cluster info before starting subprocess, and pass 
     # correct info to each subprocess
-    procs_env_list = _get_subprocess_env_list(nprocs, options)
+    procs_env_list = _get_subprocess_env_list(nprocs, options, cuda_dev_cnt)
 
     # start processes
-    # NOTE(chenweihang): [ why default start method is spawn? ]
-    # The CUDA runtime does not support the fork start method, 
-    # either the spawn or forkserver start method are required 
-    # to use CUDA in subprocesses.
+    # NOTE(chenweihang): [ why prefer forkserver on linux cpu? ]
+    # The CUDA runtime does not support the fork start method,
+    # so when paddle is compiled with CUDA the default is spawn,
+    # which re-execs a fresh interpreter and re-imports paddle in
+    # every subprocess. When paddle is a cpu-only build, no CUDA
+    # context can exist in the parent, so forkserver is safe: the
+    # server process is created once with paddle preloaded and
+    # each subprocess is cloned from it cheaply via copy-on-write
     start_method = options.get('start_method', None)
     if start_method is None:
-        start_method = 'spawn'
+        if sys.platform.startswith('linux') and \
+                not core.is_compiled_with_cuda():
+            start_method = 'forkserver'
+        else:
+            start_method = 'spawn'
     mp = multiprocessing.get_context(start_method)
-
-    error_queues = []
-    return_queues = []
+    if start_method == 'forkserver':
+        mp.set_forkserver_preload(['paddle'])
+
+    # dispatch to the persistent worker pool instead of forking new
+    # processes when the user opted in
+    if options.get('persistent', False):
+        return _spawn_persistent(func, args, nprocs, join, daemon,
+                                 start_method, procs_env_list)
+
+    # NOTE(chenweihang): [ why not use queues per process? ]
+    # Queues cost pipe pairs and pickle round-trips per process just
+    # to carry one return value or traceback. A shared memory slab
+    # with one fixed-size slot per rank needs no file descriptors
+    # per process; the overflow queue is only touched when a pickled
+    # result does not fit into its slot
+    result_slab = mp.RawArray('c', nprocs * _SLOT_SIZE)
+    overflows = mp.Queue()
+    # NOTE(chenweihang): `func` and `args` are identical for all
+    # processes, pickling them once here instead of letting the start
+    # method pickle them per process does the serialization work one
+    # time instead of nprocs times
+    payload = pickle.dumps((func, args), pickle.HIGHEST_PROTOCOL)
     processes = []
-    for i in range(nprocs):
-        error_queue = mp.SimpleQueue()
-        return_queue = mp.SimpleQueue()
+    for i, proc_env in enumerate(procs_env_list):
         process = mp.Process(
             target=_func_wrapper,
-            args=(func, args, error_queue, return_queue, procs_env_list[i]))
+            args=(payload, i, result_slab, overflows, proc_env))
         process.daemon = daemon
-        process.start()
-        error_queues.append(error_queue)
-        return_queues.append(return_queue)
         processes.append(process)
 
-    context = MultiprocessContext(processes, error_queues, return_queues)
+    # NOTE(chenweihang): [ why start processes with threads? ]
+    # Each start pays the full fork+exec cost of a new interpreter,
+    # starting them one by one serializes this cost. The GIL is
+    # released around the underlying fork call, so starting with
+    # a thread pool overlaps the per-process setup
+    with ThreadPoolExecutor(max_workers=min(nprocs, 32)) as executor:
+        list(executor.map(lambda process: process.start(), processes))
+
+    context = MultiprocessContext(processes, result_slab, overflows)
     if not join:
         return context
 
-    # loop until all process end
-    while not context.join():
-        pass
+    # block until all processes end
+    context.wait()
 
     # finally return context
     return context
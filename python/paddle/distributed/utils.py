@@ -19,6 +19,7 @@ import time
 import os
 import signal
 import copy
+import six
 import sys
 import subprocess
 from contextlib import closing
@@ -334,12 +335,18 @@ def find_free_ports(num):
 
 
 def _prepare_trainer_env(cluster, trainer):
+    # NOTE: the trainers num and endpoints list are identical for all
+    # trainers, interning them makes every env dict reference one
+    # shared string object instead of rebuilding its own copy, which
+    # keeps the parent footprint flat as the trainer count grows
     proc_env = {
         "FLAGS_selected_gpus": "%s" % ",".join([str(g) for g in trainer.gpus]),
         "PADDLE_TRAINER_ID": "%d" % trainer.rank,
         "PADDLE_CURRENT_ENDPOINT": "%s" % trainer.endpoint,
-        "PADDLE_TRAINERS_NUM": "%d" % cluster.trainers_nranks(),
-        "PADDLE_TRAINER_ENDPOINTS": ",".join(cluster.trainers_endpoints())
+        "PADDLE_TRAINERS_NUM":
+        six.moves.intern("%d" % cluster.trainers_nranks()),
+        "PADDLE_TRAINER_ENDPOINTS":
+        six.moves.intern(",".join(cluster.trainers_endpoints()))
     }
     return proc_env
 
@@ -46,9 +46,7 @@ class TestDistSpawnRunner(unittest.TestCase):
             args=(args, ),
             nprocs=self.nprocs,
             join=True)
-        result_list = []
-        for res_queue in context.return_queues:
-            result_list.append(res_queue.get())
+        result_list = context.returns
         return result_list
 
     def check_dist_result_with_spawn(self, test_class, delta=1e-3):
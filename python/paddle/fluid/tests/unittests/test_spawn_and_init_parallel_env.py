@@ -14,13 +14,20 @@
 
 from __future__ import print_function
 
+import multiprocessing
 import os
+import pickle
 import numpy as np
 import unittest
 
 import paddle
 import paddle.distributed as dist
 from paddle.distributed.spawn import _get_subprocess_env_list
+from paddle.distributed.spawn import _remove_risky_env
+from paddle.distributed.spawn import _write_result_slot
+from paddle.distributed.spawn import _SLOT_SIZE, _STATUS_EMPTY, _STATUS_SUCCESS
+from paddle.distributed.spawn import MultiprocessContext, _WorkerPool
+from paddle.distributed.spawn import _func_wrapper, _WorkerPoolContext
 
 from paddle.fluid import core
 from paddle.fluid.dygraph import parallel_helper
@@ -72,10 +79,123 @@ class TestSpawnAssistMethod(unittest.TestCase):
             _get_subprocess_env_list(nprocs=2, options=options)
 
     def test_get_correct_env(self):
-        env_dict = _get_subprocess_env_list(nprocs=1, options=dict())[0]
+        env_dict = next(iter(_get_subprocess_env_list(nprocs=1, options=dict())))
         self.assertEqual(env_dict['PADDLE_TRAINER_ID'], '0')
         self.assertEqual(env_dict['PADDLE_TRAINERS_NUM'], '1')
 
 
+def _pool_double_func(value):
+    return value * 2
+
+
+def _oversized_return_func():
+    return b'x' * (4 * _SLOT_SIZE)
+
+
+def _pool_exit_func():
+    # die without reporting a result and with a clean exit code
+    os._exit(0)
+
+
+def _pool_sleep_func(seconds):
+    import time
+    time.sleep(seconds)
+    return 'done'
+
+
+class TestSpawnRemoveRiskyEnv(unittest.TestCase):
+    def test_all_proxy_spellings_removed(self):
+        os.environ['http_proxy'] = 'http://127.0.0.1:8888'
+        os.environ['HTTPS_PROXY'] = 'http://127.0.0.1:8888'
+        _remove_risky_env()
+        self.assertNotIn('http_proxy', os.environ)
+        self.assertNotIn('HTTPS_PROXY', os.environ)
+
+
+class TestSpawnResultSlot(unittest.TestCase):
+    def _make_transport(self, nprocs):
+        slab = multiprocessing.RawArray('c', nprocs * _SLOT_SIZE)
+        overflows = multiprocessing.Queue()
+        return slab, overflows
+
+    def test_write_and_read_result_slot(self):
+        slab, overflows = self._make_transport(2)
+        _write_result_slot(slab, overflows, 1, _STATUS_SUCCESS,
+                           pickle.dumps([1, 2, 3]))
+        context = MultiprocessContext([], slab, overflows)
+        status, payload = context._read_result_slot(1)
+        self.assertEqual(status, _STATUS_SUCCESS)
+        self.assertEqual(pickle.loads(payload), [1, 2, 3])
+        # an unwritten slot reports empty
+        status, _ = context._read_result_slot(0)
+        self.assertEqual(status, _STATUS_EMPTY)
+
+    def test_oversized_payload_uses_overflow_queue(self):
+        slab, overflows = self._make_transport(1)
+        payload = pickle.dumps(b'x' * (2 * _SLOT_SIZE))
+        _write_result_slot(slab, overflows, 0, _STATUS_SUCCESS, payload)
+        context = MultiprocessContext([], slab, overflows)
+        status, read_payload = context._read_result_slot(0)
+        self.assertEqual(status, _STATUS_SUCCESS)
+        self.assertEqual(read_payload, payload)
+
+    def test_child_oversized_return_does_not_deadlock_wait(self):
+        # the child must be able to exit before the parent reads the
+        # overflow payload, otherwise wait() deadlocks
+        mp = multiprocessing.get_context('fork')
+        slab = mp.RawArray('c', _SLOT_SIZE)
+        overflows = mp.Queue()
+        payload = pickle.dumps((_oversized_return_func, ()),
+                               pickle.HIGHEST_PROTOCOL)
+        process = mp.Process(
+            target=_func_wrapper, args=(payload, 0, slab, overflows, dict()))
+        process.start()
+        context = MultiprocessContext([process], slab, overflows)
+        context.wait()
+        self.assertEqual(context.returns, [b'x' * (4 * _SLOT_SIZE)])
+
+
+class TestSpawnWorkerPool(unittest.TestCase):
+    def _dispatch(self, pool, func, args, nprocs):
+        payload = pickle.dumps((func, args), pickle.HIGHEST_PROTOCOL)
+        return pool.dispatch(payload, [dict() for _ in range(nprocs)])
+
+    def test_dispatch_collect_roundtrip(self):
+        pool = _WorkerPool(2, 'fork', True)
+        try:
+            call_id = self._dispatch(pool, _pool_double_func, (21, ), 2)
+            self.assertEqual(pool.collect(call_id), [42, 42])
+        finally:
+            pool.shutdown()
+
+    def test_overlapping_calls_do_not_mix_results(self):
+        pool = _WorkerPool(2, 'fork', True)
+        try:
+            first = self._dispatch(pool, _pool_double_func, (1, ), 2)
+            second = self._dispatch(pool, _pool_double_func, (2, ), 2)
+            # collecting out of dispatch order must still match by call
+            self.assertEqual(pool.collect(second), [4, 4])
+            self.assertEqual(pool.collect(first), [2, 2])
+        finally:
+            pool.shutdown()
+
+    def test_join_timeout_returns_false_then_completes(self):
+        pool = _WorkerPool(1, 'fork', True)
+        try:
+            call_id = self._dispatch(pool, _pool_sleep_func, (2, ), 1)
+            context = _WorkerPoolContext(pool, call_id)
+            self.assertFalse(context.join(timeout=0.2))
+            context.wait()
+            self.assertEqual(context.returns, ['done'])
+        finally:
+            pool.shutdown()
+
+    def test_cleanly_exited_worker_raises(self):
+        pool = _WorkerPool(1, 'fork', True)
+        call_id = self._dispatch(pool, _pool_exit_func, (), 1)
+        with self.assertRaises(Exception):
+            pool.collect(call_id)
+
+
 if __name__ == "__main__":
     unittest.main()